@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Shared blueprint parse cache for the CI validation scripts.
+Memoizes YAML parses per file and persists them to .cache/blueprints.pkl
+so that consecutive script runs in the same CI job reuse each other's work.
+"""
+
+import atexit
+import hashlib
+import io
+import os
+import pickle
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import _ha_yaml
+
+
+_CACHE_FILE = Path(".cache/blueprints.pkl")
+_BLUEPRINT_DIR = Path("blueprints")
+_YAML_EXTS = ('.yml', '.yaml')
+
+# Parsed blueprints keyed by (path, mtime_ns, size), shared across runs
+# through the pickle file below.
+_disk_cache: Dict[Tuple[str, int, int], Any] = {}
+_dirty = False
+
+
+def block_buffer_stdout() -> None:
+    """Switch stdout to block buffering for the rest of the process.
+
+    The scripts print one line per blueprint per check; line-buffered
+    stdout flushes (and locks) on every print. Buffer in blocks instead
+    and flush once at exit.
+    """
+    try:
+        if sys.stdout.line_buffering:
+            sys.stdout = io.TextIOWrapper(sys.stdout.buffer,
+                                          encoding=sys.stdout.encoding,
+                                          write_through=False)
+            atexit.register(sys.stdout.flush)
+    except AttributeError:
+        pass  # stdout was replaced by something without a raw buffer
+
+
+def find_blueprint_files() -> List[Path]:
+    """Find all blueprint YAML files.
+
+    Walks the tree with os.scandir and works on DirEntry names, only
+    constructing Path objects for the files that are yielded; this avoids
+    the per-directory stat() overhead of pathlib.rglob.
+    """
+    root = str(_BLUEPRINT_DIR)
+    if not os.path.isdir(root):
+        return []
+
+    yaml_files = []
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(_YAML_EXTS):
+                    yaml_files.append(Path(entry.path))
+
+    return yaml_files
+
+
+def _tree_fingerprint() -> str:
+    """Combined SHA1 of the blueprint tree's file stats.
+
+    Used to invalidate the persisted cache wholesale when the tree changes.
+    """
+    digest = hashlib.sha1()
+    if _BLUEPRINT_DIR.is_dir():
+        for path in sorted(_BLUEPRINT_DIR.rglob("*")):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+def _load_disk_cache() -> None:
+    """Seed the in-memory cache from .cache/blueprints.pkl if still valid."""
+    global _disk_cache
+    try:
+        with open(_CACHE_FILE, 'rb') as file:
+            payload = pickle.load(file)
+        if payload.get('fingerprint') == _tree_fingerprint():
+            _disk_cache = payload['entries']
+    except Exception:
+        pass
+
+
+def _save_disk_cache() -> None:
+    """Write the in-memory cache back to disk (atomically) at exit."""
+    if not _dirty:
+        return
+    try:
+        _CACHE_FILE.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_FILE.parent)
+        with os.fdopen(fd, 'wb') as file:
+            pickle.dump({'fingerprint': _tree_fingerprint(),
+                         'entries': _disk_cache}, file)
+        os.replace(tmp_path, _CACHE_FILE)
+    except Exception:
+        pass
+
+
+@lru_cache(maxsize=None)
+def _parse(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, consulting the persisted cache first."""
+    global _dirty
+    key = (path, mtime_ns, size)
+    if key in _disk_cache:
+        return _disk_cache[key]
+
+    data = _ha_yaml.load(path)
+
+    _disk_cache[key] = data
+    _dirty = True
+    return data
+
+
+def load_blueprint(path: Path) -> Any:
+    """Load a blueprint YAML file, reusing any previously cached parse."""
+    stat = os.stat(path)
+    return _parse(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+_load_disk_cache()
+atexit.register(_save_disk_cache)
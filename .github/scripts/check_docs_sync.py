@@ -4,51 +4,31 @@ Check documentation synchronization with blueprints.
 Ensures documentation exists for all blueprints and is up to date.
 """
 
+import mmap
+import os
+import re
 import sys
-import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List
 
+from _blueprint_cache import (block_buffer_stdout, find_blueprint_files,
+                              load_blueprint)
 
-class HomeAssistantLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-    pass
+# Essential documentation sections, matched in one pass over each file
+_REQUIRED_SECTIONS = ('overview', 'configuration', 'setup', 'usage',
+                      'troubleshooting')
+_SECTIONS_RE = re.compile(r'\b(overview|configuration|setup|usage|'
+                          r'troubleshooting)\b', re.IGNORECASE)
 
+# Markdown links to documentation files, e.g. "(climate-foo.md)"
+_DOC_LINK_RE = re.compile(rb'\(([^)]+?\.md)\)')
 
-def construct_input(loader, node):
-    """Handle !input tags in Home Assistant blueprints."""
-    return f"!input {loader.construct_scalar(node)}"
 
-
-def construct_include(loader, node):
-    """Handle !include tags in Home Assistant configuration."""
-    return f"!include {loader.construct_scalar(node)}"
-
-
-def construct_include_dir_merge_list(loader, node):
-    """Handle !include_dir_merge_list tags."""
-    return f"!include_dir_merge_list {loader.construct_scalar(node)}"
-
-
-# Add constructors for Home Assistant specific tags
-HomeAssistantLoader.add_constructor('!input', construct_input)
-HomeAssistantLoader.add_constructor('!include', construct_include)
-HomeAssistantLoader.add_constructor('!include_dir_merge_list',
-                                  construct_include_dir_merge_list)
-HomeAssistantLoader.add_constructor('!secret', construct_include)
-
-
-def find_blueprint_files() -> List[Path]:
-    """Find all blueprint YAML files."""
-    blueprint_dir = Path("blueprints")
-    if not blueprint_dir.exists():
-        return []
-
-    yaml_files = []
-    for ext in ["*.yml", "*.yaml"]:
-        yaml_files.extend(blueprint_dir.rglob(ext))
-
-    return yaml_files
+def doc_stem(blueprint_path: Path) -> str:
+    """Derive the expected documentation stem for a blueprint file."""
+    relative_path = blueprint_path.relative_to("blueprints")
+    return '-'.join(relative_path.with_suffix('').parts)
 
 
 def find_documentation_files() -> List[Path]:
@@ -63,8 +43,7 @@ def find_documentation_files() -> List[Path]:
 def extract_blueprint_info(blueprint_path: Path) -> Dict[str, str]:
     """Extract key information from a blueprint file."""
     try:
-        with open(blueprint_path, 'r', encoding='utf-8') as file:
-            data = yaml.load(file, Loader=HomeAssistantLoader)
+        data = load_blueprint(blueprint_path)
 
         if not data or 'blueprint' not in data:
             return {}
@@ -81,17 +60,13 @@ def extract_blueprint_info(blueprint_path: Path) -> Dict[str, str]:
 
 
 def check_documentation_exists(blueprint_files: List[Path],
-                               doc_files: List[Path]) -> Dict[str, bool]:
+                               doc_stems: set,
+                               expected_stems: Dict[Path, str]) -> Dict[str, bool]:
     """Check if documentation exists for each blueprint."""
     results = {}
 
-    # Create a set of documentation file stems for quick lookup
-    doc_stems = {doc.stem for doc in doc_files}
-
     for blueprint_path in blueprint_files:
-        # Generate expected documentation filename
-        relative_path = blueprint_path.relative_to(Path("blueprints"))
-        expected_doc_name = str(relative_path).replace('/', '-').replace('.yml', '').replace('.yaml', '')
+        expected_doc_name = expected_stems[blueprint_path]
 
         # Check if documentation exists
         has_docs = expected_doc_name in doc_stems
@@ -106,40 +81,34 @@ def check_documentation_exists(blueprint_files: List[Path],
     return results
 
 
-def check_documentation_completeness(blueprint_files: List[Path]) -> bool:
+def check_documentation_completeness(blueprint_files: List[Path],
+                                     blueprint_infos: Dict[Path, Dict[str, str]],
+                                     expected_stems: Dict[Path, str],
+                                     doc_entries: Dict[str, os.DirEntry]) -> bool:
     """Check if documentation covers all blueprint features."""
     all_complete = True
 
     for blueprint_path in blueprint_files:
-        blueprint_info = extract_blueprint_info(blueprint_path)
+        blueprint_info = blueprint_infos.get(blueprint_path, {})
         if not blueprint_info:
             continue
 
-        # Generate expected documentation path
-        relative_path = blueprint_path.relative_to(Path("blueprints"))
-        doc_name = str(relative_path).replace('/', '-').replace('.yml', '').replace('.yaml', '')
-        doc_path = Path(f"docs/{doc_name}.md")
-
-        if not doc_path.exists():
+        # Look up the documentation in the directory listing built once
+        # in main() instead of stat()ing each candidate path
+        doc_entry = doc_entries.get(f"{expected_stems[blueprint_path]}.md")
+        if doc_entry is None:
             continue
+        doc_path = doc_entry.path
 
         try:
             with open(doc_path, 'r', encoding='utf-8') as file:
-                doc_content = file.read().lower()
-
-            # Check for essential documentation sections
-            required_sections = [
-                'overview',
-                'configuration',
-                'setup',
-                'usage',
-                'troubleshooting'
-            ]
-
-            missing_sections = []
-            for section in required_sections:
-                if section not in doc_content:
-                    missing_sections.append(section)
+                doc_content = file.read()
+
+            # One scan over the file collects every section it mentions
+            found_sections = {match.group(1).lower()
+                              for match in _SECTIONS_RE.finditer(doc_content)}
+            missing_sections = [section for section in _REQUIRED_SECTIONS
+                                if section not in found_sections]
 
             if missing_sections:
                 print(f"⚠️  {doc_path}: Missing sections: "
@@ -155,7 +124,8 @@ def check_documentation_completeness(blueprint_files: List[Path]) -> bool:
     return all_complete
 
 
-def check_readme_index() -> bool:
+def check_readme_index(blueprint_files: List[Path],
+                       expected_stems: Dict[Path, str]) -> bool:
     """Check if README.md properly indexes all blueprints."""
     readme_path = Path("docs/README.md")
     if not readme_path.exists():
@@ -163,20 +133,20 @@ def check_readme_index() -> bool:
         return False
 
     try:
-        with open(readme_path, 'r', encoding='utf-8') as file:
-            readme_content = file.read()
-
-        # Find all blueprint files
-        blueprint_files = find_blueprint_files()
-
-        missing_links = []
-        for blueprint_path in blueprint_files:
-            relative_path = blueprint_path.relative_to(Path("blueprints"))
-            doc_name = str(relative_path).replace('/', '-').replace('.yml', '').replace('.yaml', '')
-
-            # Check if the documentation file is linked in README
-            if f"({doc_name}.md)" not in readme_content:
-                missing_links.append(doc_name)
+        # Extract every documentation link in one pass over the mmapped
+        # README instead of reading it into memory and searching per name
+        present = set()
+        with open(readme_path, 'rb') as file:
+            if readme_path.stat().st_size > 0:
+                with mmap.mmap(file.fileno(), 0,
+                               access=mmap.ACCESS_READ) as mapped:
+                    present = {match.group(1).decode('utf-8')
+                               for match in _DOC_LINK_RE.finditer(mapped)}
+
+        doc_names = [expected_stems[blueprint_path]
+                     for blueprint_path in blueprint_files]
+        missing_links = [name for name in doc_names
+                         if f"{name}.md" not in present]
 
         if missing_links:
             print(f"⚠️  docs/README.md: Missing links to: "
@@ -193,6 +163,7 @@ def check_readme_index() -> bool:
 
 def main() -> int:
     """Main documentation sync check."""
+    block_buffer_stdout()
     print("📚 Checking documentation synchronization...")
 
     blueprint_files = find_blueprint_files()
@@ -205,14 +176,32 @@ def main() -> int:
     print(f"📁 Found {len(blueprint_files)} blueprint files")
     print(f"📄 Found {len(doc_files)} documentation files")
 
+    # Walk the trees once; every checker works from these shared lists
+    doc_stems = {doc.stem for doc in doc_files}
+    expected_stems = {blueprint_path: doc_stem(blueprint_path)
+                      for blueprint_path in blueprint_files}
+    doc_entries = {entry.name: entry for entry in os.scandir("docs")
+                   if entry.is_file()} if os.path.isdir("docs") else {}
+
+    # YAML parsing is CPU-bound, so extract blueprint info across workers
+    with ProcessPoolExecutor() as executor:
+        blueprint_infos = dict(zip(
+            blueprint_files,
+            executor.map(extract_blueprint_info, blueprint_files, chunksize=4)
+        ))
+
     # Check if documentation exists for all blueprints
-    doc_exists = check_documentation_exists(blueprint_files, doc_files)
+    doc_exists = check_documentation_exists(blueprint_files, doc_stems,
+                                            expected_stems)
 
     # Check documentation completeness
-    docs_complete = check_documentation_completeness(blueprint_files)
+    docs_complete = check_documentation_completeness(blueprint_files,
+                                                     blueprint_infos,
+                                                     expected_stems,
+                                                     doc_entries)
 
     # Check README index
-    readme_ok = check_readme_index()
+    readme_ok = check_readme_index(blueprint_files, expected_stems)
 
     # Summary
     total_blueprints = len(blueprint_files)
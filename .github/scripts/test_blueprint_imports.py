@@ -1,97 +1,42 @@
 #!/usr/bin/env python3
 """
 Test blueprint imports in Home Assistant environment.
-Simulates importing blueprints into a Home Assistant instance.
+Checks that blueprints parse cleanly and their inputs are well-formed.
 """
 
 import sys
-import yaml
-import tempfile
-import shutil
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Dict, List, Optional, Tuple
 
+from _blueprint_cache import (block_buffer_stdout, find_blueprint_files,
+                              load_blueprint)
 
-class HomeAssistantLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-    pass
+# Intern the field names compared against parsed YAML keys; repeated
+# occurrences across blueprints then hash and compare as pointer hits
+for _name in ('name', 'selector', 'default', 'input', 'blueprint',
+              'domain', 'description', 'trigger', 'action'):
+    sys.intern(_name)
 
 
-def construct_input(loader, node):
-    """Handle !input tags in Home Assistant blueprints."""
-    return f"!input {loader.construct_scalar(node)}"
+def test_blueprint_import(blueprint_path: Path) -> Tuple[bool, Optional[Dict]]:
+    """Test if a blueprint can be imported.
 
-
-def construct_include(loader, node):
-    """Handle !include tags in Home Assistant configuration."""
-    return f"!include {loader.construct_scalar(node)}"
-
-
-def construct_include_dir_merge_list(loader, node):
-    """Handle !include_dir_merge_list tags."""
-    return f"!include_dir_merge_list {loader.construct_scalar(node)}"
-
-
-# Add constructors for Home Assistant specific tags
-HomeAssistantLoader.add_constructor('!input', construct_input)
-HomeAssistantLoader.add_constructor('!include', construct_include)
-HomeAssistantLoader.add_constructor('!include_dir_merge_list',
-                                  construct_include_dir_merge_list)
-HomeAssistantLoader.add_constructor('!secret', construct_include)
-
-
-def create_test_config() -> str:
-    """Create a minimal Home Assistant configuration for testing."""
-    config_content = """
-homeassistant:
-  name: Test
-  latitude: 0
-  longitude: 0
-  elevation: 0
-  unit_system: metric
-  time_zone: UTC
-
-automation: !include_dir_merge_list automations/
-script: !include_dir_merge_list scripts/
-
-logger:
-  default: warning
-"""
-    return config_content
-
-
-def test_blueprint_import(blueprint_path: Path, config_dir: Path) -> bool:
-    """Test if a blueprint can be imported."""
+    Returns the parsed blueprint data alongside the result so callers can
+    reuse it without parsing the file again.
+    """
     try:
-        with open(blueprint_path, 'r', encoding='utf-8') as file:
-            blueprint_data = yaml.load(file, Loader=HomeAssistantLoader)
+        blueprint_data = load_blueprint(blueprint_path)
 
         if not blueprint_data or 'blueprint' not in blueprint_data:
             print(f"❌ {blueprint_path}: Invalid blueprint structure")
-            return False
-
-        # Create blueprint directory structure
-        blueprint_dir = config_dir / "blueprints" / "automation"
-        blueprint_dir.mkdir(parents=True, exist_ok=True)
-
-        # Copy blueprint file
-        target_file = blueprint_dir / blueprint_path.name
-        shutil.copy2(blueprint_path, target_file)
-
-        # Try to validate the blueprint can be loaded
-        with open(target_file, 'r', encoding='utf-8') as file:
-            loaded_data = yaml.load(file, Loader=HomeAssistantLoader)
+            return False, None
 
-        if loaded_data == blueprint_data:
-            print(f"✅ {blueprint_path}: Successfully imported")
-            return True
-        else:
-            print(f"❌ {blueprint_path}: Data mismatch after import")
-            return False
+        print(f"✅ {blueprint_path}: Successfully imported")
+        return True, blueprint_data
 
     except Exception as e:
         print(f"❌ {blueprint_path}: Import failed - {e}")
-        return False
+        return False, None
 
 
 def validate_blueprint_inputs(blueprint_data: Dict[str, Any]) -> List[str]:
@@ -128,22 +73,9 @@ def validate_blueprint_inputs(blueprint_data: Dict[str, Any]) -> List[str]:
     return issues
 
 
-def find_blueprint_files() -> List[Path]:
-    """Find all blueprint YAML files."""
-    blueprint_dir = Path("blueprints")
-    if not blueprint_dir.exists():
-        print("❌ blueprints directory not found")
-        return []
-
-    yaml_files = []
-    for ext in ["*.yml", "*.yaml"]:
-        yaml_files.extend(blueprint_dir.rglob(ext))
-
-    return yaml_files
-
-
 def main() -> int:
     """Main testing function."""
+    block_buffer_stdout()
     print("🧪 Testing blueprint imports...")
 
     files = find_blueprint_files()
@@ -153,33 +85,18 @@ def main() -> int:
 
     print(f"📁 Found {len(files)} blueprint files")
 
-    # Create temporary configuration directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        config_dir = Path(temp_dir)
-
-        # Create test configuration
-        config_file = config_dir / "configuration.yaml"
-        with open(config_file, 'w') as f:
-            f.write(create_test_config())
-
-        success_count = 0
-        for file_path in files:
-            # Test basic import
-            if test_blueprint_import(file_path, config_dir):
-                # Validate inputs
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        blueprint_data = yaml.load(file, Loader=HomeAssistantLoader)
-
-                    issues = validate_blueprint_inputs(blueprint_data)
-                    if issues:
-                        print(f"⚠️  {file_path}: Input issues found:")
-                        for issue in issues:
-                            print(f"   - {issue}")
-
-                    success_count += 1
-                except Exception as e:
-                    print(f"❌ {file_path}: Validation error - {e}")
+    success_count = 0
+    for file_path in files:
+        # Test basic import, reusing the parsed data for input checks
+        imported, blueprint_data = test_blueprint_import(file_path)
+        if imported:
+            issues = validate_blueprint_inputs(blueprint_data)
+            if issues:
+                print(f"⚠️  {file_path}: Input issues found:")
+                for issue in issues:
+                    print(f"   - {issue}")
+
+            success_count += 1
 
     print(f"\n📊 Results: {success_count}/{len(files)} blueprints "
           "imported successfully")
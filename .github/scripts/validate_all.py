@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Run every blueprint validation check from a single process.
+Amortizes interpreter startup and YAML parsing: the blueprint tree is
+walked once, each file is parsed once into the shared cache, and the
+structure, schema, import and documentation checks all reuse that work.
+Per-file results are recorded in .cache/validated.json keyed by content
+hash, so unchanged blueprints are skipped on the next run.
+"""
+
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict
+
+import check_docs_sync
+import test_blueprint_imports
+import validate_blueprint_schema
+import validate_yaml_structure
+from _blueprint_cache import block_buffer_stdout, find_blueprint_files
+
+_MANIFEST_FILE = Path(".cache/validated.json")
+
+
+def _load_manifest() -> Dict[str, bool]:
+    """Load the content-hash manifest of previously validated files."""
+    try:
+        with open(_MANIFEST_FILE, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except Exception:
+        return {}
+
+
+def _save_manifest(manifest: Dict[str, bool]) -> None:
+    """Persist the manifest for the next run."""
+    try:
+        _MANIFEST_FILE.parent.mkdir(exist_ok=True)
+        with open(_MANIFEST_FILE, 'w', encoding='utf-8') as file:
+            json.dump(manifest, file)
+    except Exception:
+        pass
+
+
+def check_file(file_path: Path) -> bool:
+    """Run every per-file check against a single blueprint."""
+    structure_ok = validate_yaml_structure.validate_yaml_file(file_path)
+    schema_ok = validate_blueprint_schema.validate_blueprint_file(file_path)
+
+    imported, blueprint_data = test_blueprint_imports.test_blueprint_import(
+        file_path)
+    if imported:
+        issues = test_blueprint_imports.validate_blueprint_inputs(
+            blueprint_data)
+        if issues:
+            print(f"⚠️  {file_path}: Input issues found:")
+            for issue in issues:
+                print(f"   - {issue}")
+
+    return structure_ok and schema_ok and imported
+
+
+def main() -> int:
+    """Run all blueprint validation checks in one process."""
+    block_buffer_stdout()
+    print("🚦 Running all blueprint validations...")
+
+    files = find_blueprint_files()
+    if not files:
+        print("⚠️  No blueprint files found")
+        return 0
+
+    print(f"📁 Found {len(files)} blueprint files")
+
+    # Hash each file once; byte-identical blueprints already validated by
+    # a previous run are skipped entirely
+    manifest = _load_manifest()
+    digests = {file_path: hashlib.blake2b(file_path.read_bytes(),
+                                          digest_size=16).hexdigest()
+               for file_path in files}
+
+    to_check = []
+    for file_path in files:
+        if manifest.get(digests[file_path]):
+            print(f"⏭️  {file_path}: Unchanged since last validated run")
+        else:
+            to_check.append(file_path)
+
+    # YAML parsing is CPU-bound, so validate files across worker processes
+    if to_check:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(check_file, to_check, chunksize=4))
+    else:
+        results = []
+
+    # Only passing hashes are recorded; failures re-run (and re-print)
+    # on the next attempt. Stale hashes are dropped.
+    checked = dict(zip(to_check, results))
+    new_manifest = {digests[file_path]: True for file_path in files
+                    if checked.get(file_path, True)}
+    _save_manifest(new_manifest)
+
+    files_ok = all(results)
+    print()
+
+    docs_ok = check_docs_sync.main() == 0
+
+    skipped = len(files) - len(to_check)
+    passed = sum(results) + skipped
+    print(f"\n📊 Results: {passed}/{len(files)} blueprints passed "
+          f"({skipped} unchanged)")
+
+    if files_ok and docs_ok:
+        print("🎉 All blueprint validations passed!")
+        return 0
+    else:
+        print("💥 Some blueprint validations failed")
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,36 +6,29 @@ Ensures all blueprint files follow Home Assistant blueprint schema requirements.
 
 import sys
 import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Any
 
+from _blueprint_cache import (block_buffer_stdout, find_blueprint_files,
+                              load_blueprint)
 
-class HomeAssistantLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-    pass
+# Intern the field names compared against parsed YAML keys; repeated
+# occurrences across blueprints then hash and compare as pointer hits
+for _name in ('name', 'selector', 'default', 'input', 'blueprint',
+              'domain', 'description', 'trigger', 'action'):
+    sys.intern(_name)
 
-
-def construct_input(loader, node):
-    """Handle !input tags in Home Assistant blueprints."""
-    return f"!input {loader.construct_scalar(node)}"
-
-
-def construct_include(loader, node):
-    """Handle !include tags in Home Assistant configuration."""
-    return f"!include {loader.construct_scalar(node)}"
-
-
-def construct_include_dir_merge_list(loader, node):
-    """Handle !include_dir_merge_list tags."""
-    return f"!include_dir_merge_list {loader.construct_scalar(node)}"
-
-
-# Add constructors for Home Assistant specific tags
-HomeAssistantLoader.add_constructor('!input', construct_input)
-HomeAssistantLoader.add_constructor('!include', construct_include)
-HomeAssistantLoader.add_constructor('!include_dir_merge_list',
-                                  construct_include_dir_merge_list)
-HomeAssistantLoader.add_constructor('!secret', construct_include)
+# Schema vocabularies, built once at import instead of per validation call
+_REQUIRED_BP_FIELDS = ('name', 'description', 'domain')
+_VALID_DOMAINS = frozenset({'automation', 'script'})
+_REQUIRED_AUTO_FIELDS = ('trigger', 'action')
+_VALID_SELECTORS = frozenset({
+    'entity', 'number', 'boolean', 'time', 'date', 'datetime',
+    'text', 'select', 'action', 'area', 'device', 'duration',
+    'icon', 'media', 'object', 'target', 'template', 'theme',
+    'color_rgb', 'color_temp', 'location'
+})
 
 
 def validate_blueprint_structure(data: Dict[str, Any], file_path: str) -> bool:
@@ -50,17 +43,15 @@ def validate_blueprint_structure(data: Dict[str, Any], file_path: str) -> bool:
     blueprint = data['blueprint']
 
     # Check required blueprint fields
-    required_fields = ['name', 'description', 'domain']
-    for field in required_fields:
+    for field in _REQUIRED_BP_FIELDS:
         if field not in blueprint:
             errors.append(f"Missing required blueprint field: '{field}'")
 
     # Validate domain
     if 'domain' in blueprint:
-        valid_domains = ['automation', 'script']
-        if blueprint['domain'] not in valid_domains:
+        if blueprint['domain'] not in _VALID_DOMAINS:
             errors.append(f"Invalid domain: {blueprint['domain']}. "
-                        f"Must be one of: {valid_domains}")
+                        f"Must be one of: {sorted(_VALID_DOMAINS)}")
 
     # Check for input section structure
     if 'input' in blueprint:
@@ -82,8 +73,7 @@ def validate_blueprint_structure(data: Dict[str, Any], file_path: str) -> bool:
 
     # Check for automation-specific fields if domain is automation
     if blueprint.get('domain') == 'automation':
-        required_auto_fields = ['trigger', 'action']
-        for field in required_auto_fields:
+        for field in _REQUIRED_AUTO_FIELDS:
             if field not in data:
                 errors.append(f"Missing required automation field: '{field}'")
 
@@ -108,14 +98,7 @@ def validate_selector(selector: Dict[str, Any], input_name: str,
         return
 
     selector_type = list(selector.keys())[0]
-    valid_selectors = [
-        'entity', 'number', 'boolean', 'time', 'date', 'datetime',
-        'text', 'select', 'action', 'area', 'device', 'duration',
-        'icon', 'media', 'object', 'target', 'template', 'theme',
-        'color_rgb', 'color_temp', 'location'
-    ]
-
-    if selector_type not in valid_selectors:
+    if selector_type not in _VALID_SELECTORS:
         errors.append(f"Input '{input_name}' has invalid selector type: "
                      f"{selector_type}")
 
@@ -123,8 +106,7 @@ def validate_selector(selector: Dict[str, Any], input_name: str,
 def validate_blueprint_file(file_path: Path) -> bool:
     """Validate a single blueprint file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = yaml.load(file, Loader=HomeAssistantLoader)
+        data = load_blueprint(file_path)
 
         if data is None:
             print(f"❌ {file_path}: Empty YAML file")
@@ -140,22 +122,9 @@ def validate_blueprint_file(file_path: Path) -> bool:
         return False
 
 
-def find_blueprint_files() -> List[Path]:
-    """Find all blueprint YAML files."""
-    blueprint_dir = Path("blueprints")
-    if not blueprint_dir.exists():
-        print("❌ blueprints directory not found")
-        return []
-
-    yaml_files = []
-    for ext in ["*.yml", "*.yaml"]:
-        yaml_files.extend(blueprint_dir.rglob(ext))
-
-    return yaml_files
-
-
 def main() -> int:
     """Main validation function."""
+    block_buffer_stdout()
     print("🔍 Validating blueprint schema compliance...")
 
     files = find_blueprint_files()
@@ -165,10 +134,11 @@ def main() -> int:
 
     print(f"📁 Found {len(files)} blueprint files")
 
-    success_count = 0
-    for file_path in files:
-        if validate_blueprint_file(file_path):
-            success_count += 1
+    # YAML parsing is CPU-bound, so validate files across worker processes
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(validate_blueprint_file, files,
+                                    chunksize=4))
+    success_count = sum(results)
 
     print(f"\n📊 Results: {success_count}/{len(files)} files passed validation")
 
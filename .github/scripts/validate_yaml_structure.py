@@ -4,45 +4,18 @@ Validate YAML structure of blueprint files.
 Ensures all YAML files are properly formed and contain required blueprint sections.
 """
 
-import os
 import sys
 import yaml
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 
-
-class HomeAssistantLoader(yaml.SafeLoader):
-    """Custom YAML loader that handles Home Assistant specific tags."""
-    pass
-
-
-def construct_input(loader, node):
-    """Handle !input tags in Home Assistant blueprints."""
-    return f"!input {loader.construct_scalar(node)}"
-
-
-def construct_include(loader, node):
-    """Handle !include tags in Home Assistant configuration."""
-    return f"!include {loader.construct_scalar(node)}"
-
-
-def construct_include_dir_merge_list(loader, node):
-    """Handle !include_dir_merge_list tags in Home Assistant configuration."""
-    return f"!include_dir_merge_list {loader.construct_scalar(node)}"
-
-
-# Add constructors for Home Assistant specific tags
-HomeAssistantLoader.add_constructor('!input', construct_input)
-HomeAssistantLoader.add_constructor('!include', construct_include)
-HomeAssistantLoader.add_constructor('!include_dir_merge_list', 
-                                  construct_include_dir_merge_list)
-HomeAssistantLoader.add_constructor('!secret', construct_include)
+from _blueprint_cache import (block_buffer_stdout, find_blueprint_files,
+                              load_blueprint)
 
 
 def validate_yaml_file(file_path):
     """Validate a single YAML file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            data = yaml.load(file, Loader=HomeAssistantLoader)
+        data = load_blueprint(file_path)
 
         if data is None:
             print(f"❌ {file_path}: Empty YAML file")
@@ -58,21 +31,9 @@ def validate_yaml_file(file_path):
         print(f"❌ {file_path}: Error reading file - {e}")
         return False
 
-def find_blueprint_files():
-    """Find all blueprint YAML files."""
-    blueprint_dir = Path("blueprints")
-    if not blueprint_dir.exists():
-        print("❌ blueprints directory not found")
-        return []
-
-    yaml_files = []
-    for ext in ["*.yml", "*.yaml"]:
-        yaml_files.extend(blueprint_dir.rglob(ext))
-
-    return yaml_files
-
 def main():
     """Main validation function."""
+    block_buffer_stdout()
     print("🔍 Validating YAML structure of blueprint files...")
 
     files = find_blueprint_files()
@@ -82,10 +43,10 @@ def main():
 
     print(f"📁 Found {len(files)} blueprint files")
 
-    success_count = 0
-    for file_path in files:
-        if validate_yaml_file(file_path):
-            success_count += 1
+    # YAML parsing is CPU-bound, so validate files across worker processes
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(validate_yaml_file, files, chunksize=4))
+    success_count = sum(results)
 
     print(f"\n📊 Results: {success_count}/{len(files)} files passed validation")
 